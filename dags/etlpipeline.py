@@ -22,48 +22,60 @@ with DAG(
     tags=["ml", "pipeline", "airflow"],
 ) as dag:
 
+    def _pipeline_config(timestamp: str):
+        # Tasks run in separate processes; rebuilding the config from the
+        # ingestion timestamp (passed via XCom) keeps them all under the
+        # same Artifacts/<timestamp>/ directory.
+        from networksecurity.constant.training_pipeline import TIMESTAMP_FORMAT
+        from networksecurity.entity.config_entity import TrainingPipelineConfig
+
+        return TrainingPipelineConfig(timestamp=datetime.strptime(timestamp, TIMESTAMP_FORMAT))
+
     def run_data_ingestion(**kwargs) -> dict:
 
         from networksecurity.entity.config_entity import TrainingPipelineConfig, DataIngestionConfig
         from networksecurity.components.data_ingestion import DataIngestion
 
-        training_config = TrainingPipelineConfig()
+        training_config = TrainingPipelineConfig(timestamp=datetime.now())
+        timestamp = training_config.timestamp
         di_config = DataIngestionConfig(training_config)
         ingestion = DataIngestion(di_config)
 
         art = ingestion.initiate_data_ingestion()
 
         return {
-            "train_csv": art.trained_file_path,
-            "test_csv": art.test_file_path,
+            "timestamp": timestamp,
+            "train_path": art.trained_file_path,
+            "test_path": art.test_file_path,
         }
 
     def run_data_validation(ti, **kwargs) -> dict:
-        from networksecurity.entity.config_entity import TrainingPipelineConfig, DataValidationConfig
+        from networksecurity.entity.config_entity import DataValidationConfig
         from networksecurity.entity.artifact_entity import DataIngestionArtifact
         from networksecurity.components.data_validation import DataValidation
 
         ingest = ti.xcom_pull(task_ids="data_ingestion")
         di_art = DataIngestionArtifact(
-            trained_file_path=ingest["train_csv"],
-            test_file_path=ingest["test_csv"],
+            trained_file_path=ingest["train_path"],
+            test_file_path=ingest["test_path"],
         )
 
-        training_config = TrainingPipelineConfig()
+        training_config = _pipeline_config(ingest["timestamp"])
         dv_config = DataValidationConfig(training_config)
         validator = DataValidation(di_art, dv_config)
 
         dv_art = validator.initiate_data_validation()
 
         return {
-            "valid_train_csv": dv_art.valid_train_file_path,
-            "valid_test_csv": dv_art.valid_test_file_path,
+            "timestamp": ingest["timestamp"],
+            "valid_train_path": dv_art.valid_train_file_path,
+            "valid_test_path": dv_art.valid_test_file_path,
             "drift_report": dv_art.drift_report_file_path,
             "validation_status": bool(dv_art.validation_status),
         }
 
     def run_data_transformation(ti, **kwargs) -> dict:
-        from networksecurity.entity.config_entity import TrainingPipelineConfig, DataTransformationConfig
+        from networksecurity.entity.config_entity import DataTransformationConfig
         from networksecurity.entity.artifact_entity import DataValidationArtifact
         from networksecurity.components.data_transformation import DataTransformation
 
@@ -71,14 +83,14 @@ with DAG(
 
         dv_art = DataValidationArtifact(
             validation_status=bool(val.get("validation_status", True)),
-            valid_train_file_path=val["valid_train_csv"],
-            valid_test_file_path=val["valid_test_csv"],
+            valid_train_file_path=val["valid_train_path"],
+            valid_test_file_path=val["valid_test_path"],
             invalid_train_file_path=None,
             invalid_test_file_path=None,
             drift_report_file_path=val["drift_report"],
         )
 
-        training_config = TrainingPipelineConfig()
+        training_config = _pipeline_config(val["timestamp"])
         dt_config = DataTransformationConfig(training_config)
         transformer = DataTransformation(dv_art, dt_config)
 
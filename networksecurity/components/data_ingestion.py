@@ -2,19 +2,29 @@ import os
 import sys
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from typing import Optional
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import StratifiedShuffleSplit
 from dotenv import load_dotenv
 
-from networksecurity.constant.training_pipeline import TARGET_COLUMN
+from networksecurity.constant.training_pipeline import TARGET_COLUMN, SCHEMA_FILE_PATH
 from networksecurity.entity.config_entity import DataIngestionConfig
 from networksecurity.entity.artifact_entity import DataIngestionArtifact
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logging.logger import logging
+from networksecurity.utils.main_utils.utils import read_yaml_file, write_parquet_file
 
 load_dotenv()  # works only if .env exists inside the container; prefer Docker envs
 MONGO_DB_URL = os.getenv("MONGODB_URL_KEY")
 
+# schema.yaml dtype -> Arrow type used when decoding the collection
+ARROW_TYPES = {
+    "int64": pa.int64(),
+    "float64": pa.float64(),
+    "bool": pa.bool_(),
+    "object": pa.string(),
+}
+
 
 class DataIngestion:
     def __init__(self, data_ingestion_config: DataIngestionConfig):
@@ -23,17 +33,53 @@ class DataIngestion:
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
+    @staticmethod
+    def _arrow_schema():
+        """
+        Build the pymongoarrow schema from the column dtypes in schema.yaml.
+        """
+        from pymongoarrow.api import Schema
+
+        columns = read_yaml_file(SCHEMA_FILE_PATH)["columns"]
+        unsupported = {name: dtype for name, dtype in columns.items() if dtype not in ARROW_TYPES}
+        if unsupported:
+            raise ValueError(
+                f"Unsupported dtypes in {SCHEMA_FILE_PATH} (column: dtype): {unsupported}; "
+                f"supported: {sorted(ARROW_TYPES)}"
+            )
+        return Schema({name: ARROW_TYPES[dtype] for name, dtype in columns.items()})
+
+    def _check_schema_coverage(self, df: pd.DataFrame) -> None:
+        """
+        Reading through the schema hides missing fields (all-null columns) and
+        type mismatches (nulled values), so surface them here.
+        """
+        if df.empty:
+            return
+        null_ratio = df.isna().mean()
+        missing = null_ratio.index[null_ratio == 1.0].tolist()
+        if missing:
+            raise ValueError(f"Schema columns absent or entirely invalid in MongoDB: {missing}")
+        threshold = self.data_ingestion_config.max_null_ratio
+        high = null_ratio[null_ratio > threshold]
+        if not high.empty:
+            logging.warning(
+                f"Columns with more than {threshold:.0%} null/invalid values: "
+                f"{high.round(4).to_dict()}"
+            )
+
     def export_collection_as_dataframe(self) -> pd.DataFrame:
         """
         Connect to MongoDB and stream the collection into a DataFrame safely.
         - Pings first to fail fast if unreachable.
         - Uses reasonable timeouts + retryable reads.
-        - Streams in batches (no giant list()).
+        - Reads into Arrow via pymongoarrow (no per-document Python dicts).
         - Disables server cursor idle timeout while iterating.
         """
         try:
             from pymongo import MongoClient
             from pymongo.errors import ServerSelectionTimeoutError, AutoReconnect
+            from pymongoarrow.api import find_pandas_all
 
             uri = MONGO_DB_URL
             if not uri:
@@ -44,7 +90,7 @@ class DataIngestion:
                 uri,
                 serverSelectionTimeoutMS=5000,   # fail fast on bad host/creds
                 connectTimeoutMS=5000,
-                socketTimeoutMS=120000,          # allow long reads
+                socketTimeoutMS=120000,          # allow long reads (large getMore batches)
                 retryWrites=True,
                 retryReads=True,
             ) as client:
@@ -56,26 +102,28 @@ class DataIngestion:
                 coll_name = self.data_ingestion_config.collection_name
                 coll = client[db_name][coll_name]
 
-                # Exclude _id at the wire
-                projection = {"_id": 0}
-
-                cursor = coll.find(
-                    {}, projection=projection
-                ).batch_size(5000)
+                # BSON is decoded straight into Arrow columns (no per-document
+                # dicts); the cursor keeps server-default getMore batching.
+                # allow_invalid turns values that do not match the schema type
+                # (e.g. "na" in numeric fields) into NaN instead of raising.
+                df = find_pandas_all(
+                    coll,
+                    {},
+                    schema=self._arrow_schema(),
+                    projection={"_id": 0},
+                    allow_invalid=True,
+                )
+                fetched = len(df)
 
-                rows = []
-                fetched = 0
-                try:
-                    for doc in cursor:
-                        rows.append(doc)
-                        fetched += 1
-                        # If you expect tens of millions, flush chunks to CSV here.
-                finally:
-                    cursor.close()
+                # "na" markers can only live in object columns; skip numeric ones
+                obj_cols = df.select_dtypes(include="object").columns
+                if len(obj_cols):
+                    df[obj_cols] = df[obj_cols].mask(df[obj_cols] == "na")
+                    # columns that only held "na" markers become numeric again
+                    df = df.infer_objects()
 
-                df = pd.DataFrame.from_records(rows)
-                if not df.empty:
-                    df.replace({"na": np.nan}, inplace=True)
+                # after the "na" mask, so markers in string fields count as nulls
+                self._check_schema_coverage(df)
 
                 logging.info(f"Data loaded from MongoDB {db_name}.{coll_name}, rows: {fetched}")
                 return df
@@ -90,8 +138,7 @@ class DataIngestion:
     def export_data_into_feature_store(self, dataframe: pd.DataFrame) -> pd.DataFrame:
         try:
             feature_store_path = self.data_ingestion_config.feature_store_file_path
-            os.makedirs(os.path.dirname(feature_store_path), exist_ok=True)
-            dataframe.to_csv(feature_store_path, index=False)
+            write_parquet_file(feature_store_path, dataframe)
             logging.info(f"Data exported to feature store at: {feature_store_path}")
             return dataframe
         except Exception as e:
@@ -104,19 +151,21 @@ class DataIngestion:
                     f"TARGET_COLUMN '{TARGET_COLUMN}' not found in dataframe", sys
                 )
 
-            train_data, test_data = train_test_split(
-                dataframe,
+            # Split row indices only; each slice is materialized just long enough to write it
+            splitter = StratifiedShuffleSplit(
+                n_splits=1,
                 test_size=self.data_ingestion_config.train_test_split_ratio,
-                stratify=dataframe[TARGET_COLUMN],
                 random_state=42,
             )
+            train_idx, test_idx = next(
+                splitter.split(np.zeros(len(dataframe)), dataframe[TARGET_COLUMN].to_numpy())
+            )
 
             train_path = self.data_ingestion_config.training_file_path
             test_path = self.data_ingestion_config.testing_file_path
-            os.makedirs(os.path.dirname(train_path), exist_ok=True)
 
-            train_data.to_csv(train_path, index=False)
-            test_data.to_csv(test_path, index=False)
+            write_parquet_file(train_path, dataframe.iloc[train_idx])
+            write_parquet_file(test_path, dataframe.iloc[test_idx])
             logging.info(f"Train and test datasets saved at: {train_path}, {test_path}")
         except Exception as e:
             raise NetworkSecurityException(e, sys)
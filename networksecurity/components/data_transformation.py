@@ -1,7 +1,10 @@
 import sys
 import os
+import warnings
 import numpy as np
 import pandas as pd
+from scipy import sparse
+from scipy.stats import skew
 
 from sklearn.impute import SimpleImputer, KNNImputer
 from sklearn.preprocessing import OneHotEncoder, StandardScaler, PowerTransformer, LabelEncoder
@@ -9,12 +12,23 @@ from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
 from sklearn.base import BaseEstimator, TransformerMixin
 
-from networksecurity.constant.training_pipeline import TARGET_COLUMN, DATA_TRANSFORMATION_IMPUTER_PARAMS
+from networksecurity.constant.training_pipeline import (
+    TARGET_COLUMN,
+    DATA_TRANSFORMATION_IMPUTER_PARAMS,
+    DATA_TRANSFORMATION_KNN_MAX_ROWS,
+    DATA_TRANSFORMATION_FLOAT32_ATOL,
+    DATA_TRANSFORMATION_ONEHOT_MIN_FREQUENCY,
+)
 from networksecurity.entity.artifact_entity import DataTransformationArtifact, DataValidationArtifact
 from networksecurity.entity.config_entity import DataTransformationConfig
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logging.logger import logging
-from networksecurity.utils.main_utils.utils import save_numpy_array_data, save_object
+from networksecurity.utils.main_utils.utils import (
+    read_parquet_file,
+    save_numpy_array_blocks,
+    save_sparse_data,
+    save_object,
+)
 
 
 class DataTransformation:
@@ -26,9 +40,24 @@ class DataTransformation:
             raise NetworkSecurityException(e, sys)
 
     @staticmethod
-    def _read_csv(path: str) -> pd.DataFrame:
+    def _read_data(path: str) -> pd.DataFrame:
         try:
-            return pd.read_csv(path)
+            df = read_parquet_file(path)
+
+            # float32/int32 halve the bytes pushed through the imputers and scalers;
+            # a column is only narrowed when no value changes beyond the tolerance
+            downcast = {}
+            for c in df.select_dtypes("float64").columns:
+                values = df[c].to_numpy()
+                if np.allclose(values.astype(np.float32), values, rtol=0,
+                               atol=DATA_TRANSFORMATION_FLOAT32_ATOL, equal_nan=True):
+                    downcast[c] = "float32"
+            ints = df.select_dtypes("int64")
+            if not ints.empty:
+                int32 = np.iinfo(np.int32)
+                fits = (ints.min() >= int32.min) & (ints.max() <= int32.max)
+                downcast.update({c: "int32" for c in fits.index[fits]})
+            return df.astype(downcast) if downcast else df
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
@@ -38,22 +67,43 @@ class DataTransformation:
             return True
         return y.nunique() <= 2
 
+    @staticmethod
+    def _skewed_columns(X: pd.DataFrame, num_cols: list, threshold: float) -> list:
+        """
+        Vectorized skew per float width so downcast float32 columns are not widened
+        into a float64 copy; all-NaN columns give NaN and are never "skewed".
+        """
+        dtypes = X.dtypes[num_cols]
+        # ints/bools: float32 unless the integer is wider than 32 bits
+        widths = [d if d.kind == "f" else np.dtype(np.float64 if d.itemsize > 4 else np.float32) for d in dtypes]
+
+        skewed = set()
+        for dtype, cols in dtypes.index.groupby(widths).items():
+            arr = X[cols].to_numpy(dtype=dtype, na_value=np.nan)
+            with warnings.catch_warnings():
+                # scipy's SmallSampleWarning for all-NaN columns; other warnings still surface
+                warnings.filterwarnings("ignore", message="After omitting NaNs", category=RuntimeWarning)
+                skews = np.ma.filled(np.abs(skew(arr, axis=0, bias=False, nan_policy="omit")), np.nan)
+            skewed.update(cols[i] for i in np.flatnonzero(skews > threshold))
+        return [c for c in num_cols if c in skewed]
+
     def _build_transformer(self, X: pd.DataFrame) -> ColumnTransformer:
         try:
             obj_cols = X.select_dtypes(include=["object", "category"]).columns.tolist()
             num_cols = X.select_dtypes(include=["number", "bool"]).columns.tolist()
 
             skew_threshold = 1.0
-            skewed = [c for c in num_cols if np.isfinite(X[c]).any() and abs(pd.Series(X[c]).dropna().skew()) > skew_threshold]
-            regular = [c for c in num_cols if c not in skewed]
+            skewed = self._skewed_columns(X, num_cols, skew_threshold)
+            skewed_set = set(skewed)
+            regular = [c for c in num_cols if c not in skewed_set]
 
             numeric_knn = Pipeline([
                 ("impute_knn", KNNImputer(**DATA_TRANSFORMATION_IMPUTER_PARAMS)),
                 ("scale", StandardScaler())
             ])
 
-            numeric_normal = Pipeline([
-                ("impute_mean", SimpleImputer(strategy="mean")),
+            numeric_median = Pipeline([
+                ("impute_median", SimpleImputer(strategy="median")),
                 ("scale", StandardScaler())
             ])
 
@@ -65,16 +115,21 @@ class DataTransformation:
 
             categorical = Pipeline([
                 ("impute_mode", SimpleImputer(strategy="most_frequent")),
-                ("onehot", OneHotEncoder(handle_unknown="ignore", sparse=True))
+                ("onehot", OneHotEncoder(
+                    handle_unknown="infrequent_if_exist",
+                    min_frequency=DATA_TRANSFORMATION_ONEHOT_MIN_FREQUENCY,
+                    sparse_output=True,
+                    dtype=np.float32,
+                ))
             ])
 
             transformers = []
-            # Prefer KNN for general numeric when feasible; still use specialized pipes for skewness
+            # KNN imputation is O(N^2) in rows; only use it on small frames, median otherwise
             if skewed:
                 transformers.append(("num_skewed", numeric_skewed, skewed))
             if regular:
-                # If KNN is desired globally, use it for the remaining numerics
-                transformers.append(("num_regular", numeric_knn, regular))
+                use_knn = X.shape[0] <= DATA_TRANSFORMATION_KNN_MAX_ROWS
+                transformers.append(("num_regular", numeric_knn if use_knn else numeric_median, regular))
             if obj_cols:
                 transformers.append(("cat", categorical, obj_cols))
 
@@ -85,25 +140,44 @@ class DataTransformation:
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
+    @staticmethod
+    def _save_transformed(file_path: str, X_t, y) -> str:
+        """
+        Append the target as the last column and save; returns the path written.
+        Sparse output (one-hot) stays sparse; both layouts are compressed .npz and
+        keep the transformer output dtype, with the class labels cast to it.
+        """
+        try:
+            y_col = np.asarray(y).reshape(-1, 1)
+            if sparse.issparse(X_t):
+                arr = sparse.hstack([X_t, sparse.csr_matrix(y_col)], format="csr", dtype=X_t.dtype)
+                save_sparse_data(file_path, arr)
+            else:
+                save_numpy_array_blocks(file_path, X_t, y_col)
+            return file_path
+        except Exception as e:
+            raise NetworkSecurityException(e, sys)
+
     def run(self) -> DataTransformationArtifact:
         logging.info("Starting data transformation")
         try:
-            train_df = self._read_csv(self.val.valid_train_file_path)
-            test_df = self._read_csv(self.val.valid_test_file_path)
+            train_df = self._read_data(self.val.valid_train_file_path)
+            test_df = self._read_data(self.val.valid_test_file_path)
 
             if TARGET_COLUMN not in train_df.columns or TARGET_COLUMN not in test_df.columns:
                 raise NetworkSecurityException(f"Missing target column '{TARGET_COLUMN}' in input files.", sys)
 
-            y_train = train_df[TARGET_COLUMN]
-            y_test = test_df[TARGET_COLUMN]
+            # pop() removes the target in place, so the remaining frame is X without a feature copy
+            y_train = train_df.pop(TARGET_COLUMN)
+            y_test = test_df.pop(TARGET_COLUMN)
+            X_train, X_test = train_df, test_df
 
             # Normalize common binary encodings
             if pd.api.types.is_numeric_dtype(y_train):
-                y_train = y_train.replace(-1, 0)
-                y_test = y_test.replace(-1, 0)
-
-            X_train = train_df.drop(columns=[TARGET_COLUMN])
-            X_test = test_df.drop(columns=[TARGET_COLUMN])
+                y_train = y_train.to_numpy(copy=True)
+                y_test = y_test.to_numpy(copy=True)
+                y_train[y_train == -1] = 0
+                y_test[y_test == -1] = 0
 
             preprocessor = self._build_transformer(X_train)
 
@@ -121,27 +195,25 @@ class DataTransformation:
                     y_test = y_encoder.transform(y_test)
                     save_object(os.path.join("final_model", "label_encoder.pkl"), y_encoder)
 
+            # Branches work on disjoint columns, so fit/transform them in parallel here only.
+            # Sequential on purpose: each call already fans the branches out to
+            # worker processes, so overlapping them would double workers and X copies
+            preprocessor.set_params(n_jobs=-1)
             preprocessor_fitted = preprocessor.fit(X_train)
             X_train_t = preprocessor_fitted.transform(X_train)
             X_test_t = preprocessor_fitted.transform(X_test)
+            # the saved preprocessor serves NetworkModel.predict; don't start a process pool per call
+            preprocessor_fitted.set_params(n_jobs=None)
 
-            if hasattr(X_train_t, "toarray"):
-                X_train_t = X_train_t.toarray()
-            if hasattr(X_test_t, "toarray"):
-                X_test_t = X_test_t.toarray()
-
-            train_arr = np.c_[X_train_t, np.asarray(y_train).reshape(-1, 1)]
-            test_arr = np.c_[X_test_t, np.asarray(y_test).reshape(-1, 1)]
-
-            save_numpy_array_data(self.cfg.transformed_train_file_path, train_arr)
-            save_numpy_array_data(self.cfg.transformed_test_file_path, test_arr)
+            train_file_path = self._save_transformed(self.cfg.transformed_train_file_path, X_train_t, y_train)
+            test_file_path = self._save_transformed(self.cfg.transformed_test_file_path, X_test_t, y_test)
             save_object(self.cfg.transformed_object_file_path, preprocessor_fitted)
             save_object(os.path.join("final_model", "preprocessor.pkl"), preprocessor_fitted)
 
             return DataTransformationArtifact(
                 transformed_object_file_path=self.cfg.transformed_object_file_path,
-                transformed_train_file_path=self.cfg.transformed_train_file_path,
-                transformed_test_file_path=self.cfg.transformed_test_file_path,
+                transformed_train_file_path=train_file_path,
+                transformed_test_file_path=test_file_path,
             )
         except Exception as e:
             raise NetworkSecurityException(e, sys)
@@ -8,7 +8,12 @@ from networksecurity.entity.config_entity import DataValidationConfig
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logging.logger import logging
 from networksecurity.constant.training_pipeline import SCHEMA_FILE_PATH
-from networksecurity.utils.main_utils.utils import read_yaml_file, write_yaml_file
+from networksecurity.utils.main_utils.utils import (
+    read_yaml_file,
+    write_yaml_file,
+    read_parquet_file,
+    write_parquet_file,
+)
 
 
 class DataValidation:
@@ -23,7 +28,7 @@ class DataValidation:
     @staticmethod
     def read_data(file_path) -> pd.DataFrame:
         try:
-            return pd.read_csv(file_path)
+            return read_parquet_file(file_path)
         except Exception as e:
             raise NetworkSecurityException(e, sys)
 
@@ -79,9 +84,8 @@ class DataValidation:
             drift_status = self.detect_dataset_drift(train_df, test_df)
 
             # Save validated data
-            os.makedirs(os.path.dirname(self.data_validation_config.valid_train_file_path), exist_ok=True)
-            train_df.to_csv(self.data_validation_config.valid_train_file_path, index=False)
-            test_df.to_csv(self.data_validation_config.valid_test_file_path, index=False)
+            write_parquet_file(self.data_validation_config.valid_train_file_path, train_df)
+            write_parquet_file(self.data_validation_config.valid_test_file_path, test_df)
 
             # Build and return artifact
             return DataValidationArtifact(
@@ -4,6 +4,7 @@ from urllib.parse import urlparse
 
 import mlflow
 import xgboost as xgb
+from scipy.sparse import issparse
 from sklearn.tree import DecisionTreeClassifier
 
 from networksecurity.exception.exception import NetworkSecurityException
@@ -107,6 +108,13 @@ class ModelTrainer:
         logging.info(f"Model trainer artifact: {model_trainer_artifact}")
         return model_trainer_artifact
 
+    @staticmethod
+    def _target_column(arr):
+        y = arr[:, -1]
+        if issparse(y):
+            return y.toarray().ravel()
+        return y
+
     def initiate_model_trainer(self) -> ModelTrainerArtifact:
         try:
             train_file_path = self.data_transformation_artifact.transformed_train_file_path
@@ -115,8 +123,8 @@ class ModelTrainer:
             train_arr = load_numpy_array_data(train_file_path)
             test_arr = load_numpy_array_data(test_file_path)
 
-            x_train, y_train = train_arr[:, :-1], train_arr[:, -1]
-            x_test, y_test = test_arr[:, :-1], test_arr[:, -1]
+            x_train, y_train = train_arr[:, :-1], self._target_column(train_arr)
+            x_test, y_test = test_arr[:, :-1], self._target_column(test_arr)
 
             return self.train_model(x_train, y_train, x_test, y_test)
 
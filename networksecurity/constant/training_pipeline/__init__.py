@@ -9,13 +9,20 @@ defining common constant variable for training pipeline
 TARGET_COLUMN = "Cover_Type"
 PIPELINE_NAME: str = "NetworkSecurity"
 ARTIFACT_DIR: str = "Artifacts"
-FILE_NAME: str = "covtype.csv"
+## artifact folders are named Artifacts/<timestamp>; the DAG passes this string between tasks
+TIMESTAMP_FORMAT: str = "%m_%d_%Y_%H_%M_%S"
+FILE_NAME: str = "covtype.parquet"
 
-TRAIN_FILE_NAME: str = "train.csv"
-TEST_FILE_NAME: str = "test.csv"
+TRAIN_FILE_NAME: str = "train.parquet"
+TEST_FILE_NAME: str = "test.parquet"
 
 SCHEMA_FILE_PATH = os.path.join("data_schema", "schema.yaml")
 
+## intermediate tabular artifacts are stored as parquet to keep dtypes and cut IO
+PARQUET_COMPRESSION: str = "zstd"
+PARQUET_COMPRESSION_LEVEL: int = 3
+PARQUET_ROW_GROUP_SIZE: int = 100_000
+
 SAVED_MODEL_DIR =os.path.join("saved_models")
 MODEL_FILE_NAME = "model.pkl"
 
@@ -31,6 +38,8 @@ DATA_INGESTION_DIR_NAME: str = "data_ingestion"
 DATA_INGESTION_FEATURE_STORE_DIR: str = "feature_store"
 DATA_INGESTION_INGESTED_DIR: str = "ingested"
 DATA_INGESTION_TRAIN_TEST_SPLIT_RATION: float = 0.2
+## share of null/invalid values per column above which ingestion logs a warning
+DATA_INGESTION_MAX_NULL_RATIO: float = 0.05
 
 """
 Data Validation related constant start with DATA_VALIDATION VAR NAME
@@ -55,9 +64,15 @@ DATA_TRANSFORMATION_IMPUTER_PARAMS: dict = {
     "n_neighbors": 3,
     "weights": "uniform",
 }
-DATA_TRANSFORMATION_TRAIN_FILE_PATH: str = "train.npy"
-
-DATA_TRANSFORMATION_TEST_FILE_PATH: str = "test.npy"
+## above this many training rows the knn imputer is replaced by a median imputer
+DATA_TRANSFORMATION_KNN_MAX_ROWS: int = 10_000
+## float64 inputs are read as float32 only if every value round-trips within this absolute error
+DATA_TRANSFORMATION_FLOAT32_ATOL: float = 1e-6
+## categories rarer than this share of rows are merged into one "infrequent" one-hot column
+DATA_TRANSFORMATION_ONEHOT_MIN_FREQUENCY: float = 0.01
+DATA_TRANSFORMATION_TRAIN_FILE_PATH: str = "train.npz"
+
+DATA_TRANSFORMATION_TEST_FILE_PATH: str = "test.npz"
 
 
 """
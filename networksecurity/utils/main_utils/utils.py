@@ -1,11 +1,21 @@
 import os
 import sys
 import yaml
-import pickle
+import zipfile
+import joblib
 import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from scipy import sparse
 from sklearn.model_selection import GridSearchCV
 from sklearn.metrics import f1_score
 
+from networksecurity.constant.training_pipeline import (
+    PARQUET_COMPRESSION,
+    PARQUET_COMPRESSION_LEVEL,
+    PARQUET_ROW_GROUP_SIZE,
+)
 from networksecurity.exception.exception import NetworkSecurityException
 from networksecurity.logging.logger import logging
 
@@ -38,14 +48,81 @@ def write_yaml_file(file_path: str, content: object, replace: bool = False) -> N
         raise NetworkSecurityException(e, sys)
 
 
+def read_parquet_file(file_path: str) -> pd.DataFrame:
+    """
+    Load a DataFrame from a parquet file, keeping the stored dtypes.
+    Arrow buffers are released column by column as pandas takes them over.
+    """
+    try:
+        table = pq.read_table(file_path, use_threads=True)
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def write_parquet_file(file_path: str, dataframe: pd.DataFrame) -> None:
+    """
+    Store a DataFrame as a compressed parquet file.
+    Rows are converted to Arrow one row group at a time, so only a single
+    slice is held as an Arrow copy alongside the DataFrame.
+    """
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        schema = pa.Schema.from_pandas(dataframe, preserve_index=False)
+        with pq.ParquetWriter(
+            file_path,
+            schema,
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL,
+        ) as writer:
+            for start in range(0, len(dataframe), PARQUET_ROW_GROUP_SIZE):
+                chunk = dataframe.iloc[start:start + PARQUET_ROW_GROUP_SIZE]
+                writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
 def save_numpy_array_data(file_path: str, array: np.array) -> None:
     """
-    Store a numpy array to a file in binary format.
+    Store a numpy array to a compressed .npz file under the key "arr".
     """
     try:
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
         with open(file_path, "wb") as file:
-            np.save(file, array)
+            np.savez_compressed(file, arr=array)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def save_numpy_array_blocks(file_path: str, features: np.array, target: np.array, block_size: int = 100_000) -> None:
+    """
+    Store features with the target appended as the last column, writing row blocks.
+    Produces the same compressed .npz layout as save_numpy_array_data without
+    building the full concatenated array in memory. The array keeps the features
+    dtype; the target (class labels) must be exactly representable in it.
+    """
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        target = np.asarray(target).reshape(-1)
+        n_rows, n_cols = features.shape
+        dtype = features.dtype
+        if not np.array_equal(target.astype(dtype), target):
+            raise ValueError(f"Target values are not exactly representable as {dtype}")
+        header = {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": (n_rows, n_cols + 1),
+        }
+
+        with zipfile.ZipFile(file_path, "w", compression=zipfile.ZIP_DEFLATED, allowZip64=True) as archive:
+            with archive.open("arr.npy", "w", force_zip64=True) as entry:
+                np.lib.format.write_array_header_1_0(entry, header)
+                for start in range(0, n_rows, block_size):
+                    stop = min(start + block_size, n_rows)
+                    block = np.empty((stop - start, n_cols + 1), dtype=dtype)
+                    block[:, :-1] = features[start:stop]
+                    block[:, -1] = target[start:stop]
+                    entry.write(block.tobytes())
     except Exception as e:
         raise NetworkSecurityException(e, sys)
 
@@ -53,24 +130,54 @@ def save_numpy_array_data(file_path: str, array: np.array) -> None:
 def load_numpy_array_data(file_path: str) -> np.array:
     """
     Load numpy array from the specified file path.
+    Plain .npy files are still read; files written by save_sparse_data come back as CSR.
+    """
+    try:
+        with open(file_path, "rb") as file:
+            data = np.load(file, allow_pickle=True)
+            if not isinstance(data, np.lib.npyio.NpzFile):
+                return data
+            with data:
+                if "arr" in data.files:
+                    return data["arr"]
+        return load_sparse_data(file_path)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def save_sparse_data(file_path: str, matrix: sparse.spmatrix) -> None:
+    """
+    Store a scipy sparse matrix to a compressed .npz file.
+    """
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, "wb") as file:
+            sparse.save_npz(file, matrix, compressed=True)
+    except Exception as e:
+        raise NetworkSecurityException(e, sys)
+
+
+def load_sparse_data(file_path: str) -> sparse.csr_matrix:
+    """
+    Load a scipy sparse matrix saved with save_sparse_data.
     """
     try:
         with open(file_path, "rb") as file:
-            return np.load(file, allow_pickle=True)
+            return sparse.load_npz(file).tocsr()
     except Exception as e:
         raise NetworkSecurityException(e, sys)
 
 
 def save_object(file_path: str, obj: object) -> None:
     """
-    Serialize and save an object using pickle.
+    Serialize and save an object using joblib with zlib compression.
     """
     try:
         logging.info("Saving object to file...")
         os.makedirs(os.path.dirname(file_path), exist_ok=True)
 
         with open(file_path, "wb") as file:
-            pickle.dump(obj, file)
+            joblib.dump(obj, file, compress=("zlib", 3))
 
         logging.info("Object successfully saved.")
 
@@ -80,14 +187,14 @@ def save_object(file_path: str, obj: object) -> None:
 
 def load_object(file_path: str) -> object:
     """
-    Load and return a pickled object from file.
+    Load and return an object saved with save_object (plain pickles still load).
     """
     try:
         if not os.path.exists(file_path):
             raise FileNotFoundError(f"File not found: {file_path}")
 
         with open(file_path, "rb") as file:
-            return pickle.load(file)
+            return joblib.load(file)
 
     except Exception as e:
         raise NetworkSecurityException(e, sys)
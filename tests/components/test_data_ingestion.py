@@ -0,0 +1,140 @@
+"""Tests for reading the Mongo collection through the schema.yaml Arrow schema."""
+
+import os
+
+import bson
+import numpy as np
+import pandas as pd
+import pymongo
+import pymongoarrow.api
+import pytest
+from pymongoarrow.context import PyMongoArrowContext
+
+from networksecurity.components import data_ingestion
+from networksecurity.constant.training_pipeline import DATA_INGESTION_COLLECTION_NAME
+from networksecurity.components.data_ingestion import DataIngestion
+from networksecurity.entity.config_entity import DataIngestionConfig, TrainingPipelineConfig
+from networksecurity.exception.exception import NetworkSecurityException
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def ingestion(monkeypatch):
+    # SCHEMA_FILE_PATH is relative to the project root
+    monkeypatch.chdir(REPO_ROOT)
+    return DataIngestion(DataIngestionConfig(TrainingPipelineConfig()))
+
+
+def _decode(schema, docs, allow_invalid=True):
+    context = PyMongoArrowContext(schema, allow_invalid=allow_invalid)
+    for doc in docs:
+        context.process_bson_stream(bson.encode(doc))
+    return context.finish().to_pandas()
+
+
+class _FakeClient:
+    """Stands in for MongoClient; the collection is just the list of documents."""
+
+    def __init__(self, docs):
+        self.docs = docs
+        self.admin = self
+
+    def command(self, name):
+        return {"ok": 1}
+
+    def __getitem__(self, db_name):
+        return {DATA_INGESTION_COLLECTION_NAME: self.docs}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+@pytest.fixture
+def mongo_docs(monkeypatch):
+    """
+    route export_collection_as_dataframe to in-memory documents; decoding still goes
+    through pymongoarrow with the schema and allow_invalid the component passes
+    """
+    docs = []
+
+    def fake_find_pandas_all(collection, query, *, schema=None, allow_invalid=False, projection=None):
+        return _decode(schema, collection, allow_invalid=allow_invalid)
+
+    monkeypatch.setattr(data_ingestion, "MONGO_DB_URL", "mongodb://fake")
+    monkeypatch.setattr(pymongo, "MongoClient", lambda *args, **kwargs: _FakeClient(docs))
+    monkeypatch.setattr(pymongoarrow.api, "find_pandas_all", fake_find_pandas_all)
+    return docs
+
+
+def test_na_strings_in_numeric_fields_become_nan(ingestion):
+    """
+    "na" markers inside int64 schema fields are nulled instead of failing the read
+    """
+    schema = ingestion._arrow_schema()
+    good = {name: 1 for name in schema.typemap}
+    bad = dict(good, Elevation="na")
+
+    df = _decode(schema, [good, bad])
+
+    assert list(df.columns) == list(schema.typemap)
+    assert df["Elevation"].iloc[0] == 1
+    assert np.isnan(df["Elevation"].iloc[1])
+    assert df["Aspect"].tolist() == [1, 1]
+
+
+def test_check_schema_coverage_rejects_missing_column(ingestion):
+    """
+    a schema column that never appears in Mongo comes back all-null and must fail
+    """
+    df = pd.DataFrame({"a": [1.0, 2.0], "b": [np.nan, np.nan]})
+    with pytest.raises(ValueError, match="b"):
+        ingestion._check_schema_coverage(df)
+
+
+def test_check_schema_coverage_accepts_partial_nulls(ingestion):
+    """
+    isolated invalid values are only logged
+    """
+    df = pd.DataFrame({"a": [1.0, np.nan, 3.0], "b": [1.0, 2.0, 3.0]})
+    ingestion._check_schema_coverage(df)
+
+
+def test_export_collection_nulls_na_markers(ingestion, mongo_docs):
+    """
+    the full export path turns "na" in numeric fields into NaN instead of raising
+    """
+    names = list(ingestion._arrow_schema().typemap)
+    good = {name: 1 for name in names}
+    mongo_docs.extend([good, dict(good, Elevation="na"), good])
+
+    df = ingestion.export_collection_as_dataframe()
+
+    assert list(df.columns) == names
+    assert len(df) == 3
+    assert df["Elevation"].isna().tolist() == [False, True, False]
+
+
+def test_export_collection_fails_on_missing_field(ingestion, mongo_docs):
+    """
+    a schema field absent from every document fails the export
+    """
+    names = list(ingestion._arrow_schema().typemap)
+    mongo_docs.extend([{name: 1 for name in names if name != "Slope"}] * 2)
+
+    with pytest.raises(NetworkSecurityException, match="Slope"):
+        ingestion.export_collection_as_dataframe()
+
+
+def test_arrow_schema_rejects_unsupported_dtype(ingestion, monkeypatch):
+    """
+    unknown schema.yaml dtypes name the column and dtype
+    """
+    monkeypatch.setattr(
+        data_ingestion, "read_yaml_file", lambda path: {"columns": {"Elevation": "float32"}}
+    )
+    with pytest.raises(ValueError, match="Elevation.*float32"):
+        ingestion._arrow_schema()
@@ -0,0 +1,36 @@
+"""Round-trip tests for the transformed-array writers in main_utils."""
+
+import numpy as np
+import pytest
+
+from networksecurity.utils.main_utils.utils import load_numpy_array_data, save_numpy_array_blocks
+
+
+@pytest.mark.parametrize("n_rows", [250, 0], ids=["multi_block", "zero_rows"])
+def test_save_numpy_array_blocks_matches_np_c(tmp_path, n_rows):
+    """
+    block-written .npz loads back equal to np.c_[features, target] in the features dtype
+    """
+    rng = np.random.default_rng(0)
+    features = rng.normal(size=(n_rows, 4)).astype(np.float32)
+    target = rng.integers(0, 3, size=(n_rows, 1))
+    file_path = str(tmp_path / "transformed" / "train.npz")
+
+    save_numpy_array_blocks(file_path, features, target, block_size=100)
+    loaded = load_numpy_array_data(file_path)
+
+    # stored in the features dtype; integer class labels are exact in float32
+    expected = np.c_[features, target].astype(np.float32)
+    assert loaded.dtype == np.float32
+    assert loaded.shape == expected.shape
+    np.testing.assert_array_equal(loaded, expected)
+
+
+def test_save_numpy_array_blocks_rejects_inexact_target(tmp_path):
+    """
+    a target that the features dtype cannot hold exactly is refused, not rounded
+    """
+    features = np.zeros((3, 2), dtype=np.float32)
+    target = np.array([0, 1, 2**24 + 1])
+    with pytest.raises(Exception, match="not exactly representable"):
+        save_numpy_array_blocks(str(tmp_path / "train.npz"), features, target)